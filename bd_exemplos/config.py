@@ -25,11 +25,16 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import toml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib  # type: ignore[no-redef]
 
 
 @dataclass(frozen=True)
@@ -51,67 +56,77 @@ class MySQLConfig:
     database: str
 
 
-def _require_str(d: dict[str, Any], key: str) -> str:
-    """Extract a required non-empty string from a dict.
+# Validation table for the [mysql] section: (key, expected type, required).
+# Optional string fields default to "" when missing or empty (e.g. password).
+_SCHEMA: tuple[tuple[str, type, bool], ...] = (
+    ("host", str, True),
+    ("port", int, True),
+    ("user", str, True),
+    ("password", str, False),
+    ("database", str, True),
+)
+
+
+def _compile_validator(key: str, expected_type: type, required: bool):
+    """Compile one schema entry into a specialized validator closure.
+
+    The type/required branching and error message are resolved once at
+    import instead of on every ``load_config`` call, in the spirit of
+    compiled-schema validators: each closure only does the checks its
+    field actually needs.
 
     Args:
-        d: Dictionary containing the key.
-        key: Key to look up.
+        key: Config key the validator extracts.
+        expected_type: ``str`` or ``int``. Integers must be positive; strings
+            are stripped and, when required, must be non-empty.
+        required: Whether the key must be present with a usable value.
+            Optional strings default to "" when missing or empty.
 
     Returns:
-        Stripped string value.
-
-    Raises:
-        ValueError: If key is missing, value is not a string, or value is empty
-            after stripping.
+        A callable ``check(d)`` that extracts and validates ``d[key]``,
+        raising ValueError on bad or missing values.
     """
-    v = d.get(key)
-    if not isinstance(v, str) or not v.strip():
-        raise ValueError(f"Invalid or missing '{key}' (expected non-empty string).")
-    return v.strip()
-
+    if expected_type is int:
+        err = f"Invalid or missing '{key}' (expected positive int)."
 
-def _optional_str(d: dict[str, Any], key: str, default: str = "") -> str:
-    """Extract an optional string from a dict, with default for missing/empty.
+        def check(d: dict[str, Any]) -> int:
+            v = d.get(key)
+            # Exact type check: bool subclasses int, so isinstance would let
+            # `port = true` slip through as 1.
+            if type(v) is not int or v <= 0:
+                raise ValueError(err)
+            return v
 
-    Used for optional fields such as password (empty string for no password).
+        return check
 
-    Args:
-        d: Dictionary containing the key.
-        key: Key to look up.
-        default: Value to return if key is missing or value is empty. Defaults to "".
+    if not required:
+        err = f"Invalid '{key}' (expected string or missing)."
 
-    Returns:
-        Stripped string value, or default.
+        def check(d: dict[str, Any]) -> str:
+            v = d.get(key)
+            if v is None:
+                return ""
+            if not isinstance(v, str):
+                raise ValueError(err)
+            return v.strip()
 
-    Raises:
-        ValueError: If value is present but not a string.
-    """
-    v = d.get(key)
-    if v is None:
-        return default
-    if not isinstance(v, str):
-        raise ValueError(f"Invalid '{key}' (expected string or missing).")
-    return v.strip() if v.strip() else default
+        return check
 
+    err = f"Invalid or missing '{key}' (expected non-empty string)."
 
-def _require_int(d: dict[str, Any], key: str) -> int:
-    """Extract a required positive integer from a dict.
+    def check(d: dict[str, Any]) -> str:
+        v = d.get(key)
+        if not isinstance(v, str) or not v.strip():
+            raise ValueError(err)
+        return v.strip()
 
-    Args:
-        d: Dictionary containing the key.
-        key: Key to look up.
+    return check
 
-    Returns:
-        Integer value.
 
-    Raises:
-        ValueError: If key is missing, value is not an int, or value is not positive.
-    """
-    v = d.get(key)
-    if not isinstance(v, int) or v <= 0:
-        raise ValueError(f"Invalid or missing '{key}' (expected positive int).")
-    return v
+# Validators compiled once at import, one specialized closure per field.
+_VALIDATORS: tuple[tuple[str, Any], ...] = tuple(
+    (key, _compile_validator(key, typ, required)) for key, typ, required in _SCHEMA
+)
 
 
 def load_config(path: Path) -> MySQLConfig:
@@ -121,6 +136,11 @@ def load_config(path: Path) -> MySQLConfig:
     keys: ``host``, ``port``, ``user``, ``database`` (all required),
     and ``password`` (optional; defaults to empty string).
 
+    Results are memoized per ``(path, mtime)`` (``MySQLConfig`` is frozen,
+    so sharing is safe): a rewritten file is re-parsed automatically, while
+    repeated loads of an unchanged file are dict lookups. Call
+    ``load_config.cache_clear()`` to drop the cache explicitly.
+
     Args:
         path: Path to the TOML file (e.g. ``config.toml``). File must exist
             and be readable as UTF-8.
@@ -134,10 +154,37 @@ def load_config(path: Path) -> MySQLConfig:
             is missing, or any required field is missing or invalid (e.g. port
             not a positive integer, host empty).
     """
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    return _load_config_cached(path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: Path, mtime_ns: int) -> MySQLConfig:
+    """Parse and validate the config file; cached per (path, mtime)."""
+    return _load_from_bytes(path.read_bytes())
+
+
+def _load_from_bytes(raw: bytes) -> MySQLConfig:
+    """Parse and validate config TOML from an in-memory bytes buffer.
+
+    The parsing/validation core of ``load_config``, split out so callers
+    that already hold the content (tests, embedded defaults) can skip the
+    filesystem entirely.
+
+    Args:
+        raw: UTF-8 encoded TOML document.
+
+    Returns:
+        A frozen ``MySQLConfig`` instance with all fields populated.
 
-    data = toml.loads(path.read_text(encoding="utf-8"))
+    Raises:
+        ValueError: If the content is not valid TOML, the ``[mysql]``
+            section is missing, or any required field is missing or invalid.
+    """
+    data = tomllib.load(io.BytesIO(raw))
     if not isinstance(data, dict):
         raise ValueError("Config root must be a TOML table/object.")
 
@@ -145,10 +192,9 @@ def load_config(path: Path) -> MySQLConfig:
     if not isinstance(mysql, dict):
         raise ValueError("Missing [mysql] section in config.")
 
-    host = _require_str(mysql, "host")
-    port = _require_int(mysql, "port")
-    user = _require_str(mysql, "user")
-    password = _optional_str(mysql, "password", default="")
-    database = _require_str(mysql, "database")
+    vals = {key: check(mysql) for key, check in _VALIDATORS}
+    return MySQLConfig(**vals)
+
 
-    return MySQLConfig(host=host, port=port, user=user, password=password, database=database)
+# Keep the documented escape hatch on the public function.
+load_config.cache_clear = _load_config_cached.cache_clear  # type: ignore[attr-defined]
@@ -1,17 +1,101 @@
-"""Shared MySQL connection helper for seed scripts.
+"""Shared MySQL helpers for seed scripts.
 
-This module provides a single function to open a MySQL connection with
-basic validation of host and port. Used by both the shop and library
-seed scripts to avoid code duplication.
+This module provides a function to open a MySQL connection with basic
+validation of host and port, plus batched-insert helpers (``chunked``,
+``exec_many``). Used by all seed scripts to avoid code duplication.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
 import mysql.connector
 from mysql.connector.connection import MySQLConnection
+from mysql.connector.pooling import MySQLConnectionPool
+
+# Pools are cached per server identity so repeated runs in the same process
+# (tests, CI loops) reuse connections instead of re-doing the handshake.
+_pools: dict[tuple[str, int, str], MySQLConnectionPool] = {}
+
+
+def get_pool(
+    *,
+    host: str,
+    port: int,
+    user: str,
+    password: str,
+    size: int = 5,
+    client_flags: list[int] | None = None,
+    use_pure: bool | None = None,
+    allow_local_infile: bool | None = None,
+) -> MySQLConnectionPool:
+    """Return a (cached) connection pool for the given server.
+
+    Pools are cached at module level keyed by ``(host, port, user)``; the
+    first call creates the pool, later calls reuse it so short-lived callers
+    skip the TCP + auth handshake.
+
+    Args:
+        host: Server hostname or IP address. Must be non-empty.
+        port: Server port. Must be a positive integer (e.g. 3306).
+        user: MySQL user name.
+        password: MySQL password (may be empty string).
+        size: Pool size for a newly created pool (ignored for cached pools).
+        client_flags: Optional client capability flags applied when the pool
+            is created (ignored for cached pools, like ``size``).
+        use_pure: Driver implementation selector applied when the pool is
+            created (ignored for cached pools, like ``size``); ``False``
+            selects the C extension.
+        allow_local_infile: Enables ``LOAD DATA LOCAL INFILE`` on pooled
+            connections when set (ignored for cached pools, like ``size``).
+
+    Returns:
+        A ``MySQLConnectionPool``; call ``get_connection()`` on it to borrow
+        a connection (closing the connection returns it to the pool).
+
+    Raises:
+        ValueError: If ``host`` is empty or ``port`` is not positive.
+        mysql.connector.Error: If the pool cannot be created.
+    """
+    if not host:
+        raise ValueError("host must be non-empty")
+    if port <= 0:
+        raise ValueError("port must be > 0")
+    key = (host, port, user)
+    pool = _pools.get(key)
+    if pool is None:
+        kwargs: dict[str, Any] = {
+            "pool_name": "bd_exemplos",
+            "pool_size": size,
+            "host": host,
+            "port": port,
+            "user": user,
+            "password": password,
+        }
+        if client_flags is not None:
+            kwargs["client_flags"] = client_flags
+        if use_pure is not None:
+            kwargs["use_pure"] = use_pure
+        if allow_local_infile is not None:
+            kwargs["allow_local_infile"] = allow_local_infile
+        pool = MySQLConnectionPool(**kwargs)
+        _pools[key] = pool
+    return pool
 
 
-def connect_mysql(*, host: str, port: int, user: str, password: str) -> MySQLConnection:
+def connect_mysql(
+    *,
+    host: str,
+    port: int,
+    user: str,
+    password: str,
+    client_flags: list[int] | None = None,
+    pool: bool = False,
+    use_pure: bool | None = None,
+    allow_local_infile: bool | None = None,
+) -> MySQLConnection:
     """Open a connection to a MySQL server.
 
     Args:
@@ -20,10 +104,25 @@ def connect_mysql(*, host: str, port: int, user: str, password: str) -> MySQLCon
         user: MySQL user name.
         password: MySQL password (may be empty string if the server allows
             no password for this user).
+        client_flags: Optional client capability flags to forward to the
+            driver (e.g. ``[ClientFlag.MULTI_STATEMENTS]`` to allow several
+            ``;``-separated statements in one round trip). With ``pool``
+            they only take effect when this call creates the pool.
+        pool: If true, borrow a connection from the cached pool (see
+            ``get_pool``) instead of opening a dedicated one; closing it
+            returns it to the pool.
+        use_pure: Forwarded to the driver when set; ``False`` selects the
+            C-extension implementation, which does per-row parameter
+            conversion (dates, decimals) in C instead of Python.
+        allow_local_infile: Forwarded to the driver when set; ``True``
+            enables ``LOAD DATA LOCAL INFILE`` so bulk loads can stream a
+            client-side file into the server's bulk loader. The server must
+            also have ``local_infile`` enabled.
 
     Returns:
-        An open ``MySQLConnection``. The caller is responsible for closing
-        it (e.g. with a ``finally`` block or context manager).
+        An open ``MySQLConnection`` (or pooled equivalent). The caller is
+        responsible for closing it (e.g. with a ``finally`` block or context
+        manager).
 
     Raises:
         ValueError: If ``host`` is empty or ``port`` is not positive.
@@ -34,4 +133,188 @@ def connect_mysql(*, host: str, port: int, user: str, password: str) -> MySQLCon
         raise ValueError("host must be non-empty")
     if port <= 0:
         raise ValueError("port must be > 0")
-    return mysql.connector.connect(host=host, port=port, user=user, password=password)
+    if pool:
+        return get_pool(
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            client_flags=client_flags,
+            use_pure=use_pure,
+            allow_local_infile=allow_local_infile,
+        ).get_connection()
+    kwargs: dict[str, Any] = {"host": host, "port": port, "user": user, "password": password}
+    if client_flags is not None:
+        kwargs["client_flags"] = client_flags
+    if use_pure is not None:
+        kwargs["use_pure"] = use_pure
+    if allow_local_infile is not None:
+        kwargs["allow_local_infile"] = allow_local_infile
+    return mysql.connector.connect(**kwargs)
+
+
+class LazyMySQLConnection:
+    """Connection proxy that defers the TCP/auth handshake until first use.
+
+    Stores the connection parameters and opens the real connection only on
+    first attribute access, then caches it. Useful for code paths that may
+    never issue a query (dry runs, upstream validation failures, tests).
+
+    Attributes are otherwise forwarded transparently to the underlying
+    ``MySQLConnection``.
+    """
+
+    def __init__(self, *, host: str, port: int, user: str, password: str) -> None:
+        """Store connection parameters without connecting.
+
+        Args:
+            host: Server hostname or IP address. Must be non-empty.
+            port: Server port. Must be a positive integer.
+            user: MySQL user name.
+            password: MySQL password (may be empty string).
+
+        Raises:
+            ValueError: If ``host`` is empty or ``port`` is not positive.
+        """
+        if not host:
+            raise ValueError("host must be non-empty")
+        if port <= 0:
+            raise ValueError("port must be > 0")
+        self._params = {"host": host, "port": port, "user": user, "password": password}
+        self._conn: MySQLConnection | None = None
+
+    def __getattr__(self, name: str):
+        """Connect on first access and forward the attribute lookup."""
+        if self._conn is None:
+            self._conn = mysql.connector.connect(**self._params)
+        return getattr(self._conn, name)
+
+
+def connect_mysql_lazy(
+    *, host: str, port: int, user: str, password: str
+) -> LazyMySQLConnection:
+    """Return a lazy MySQL connection proxy (no handshake until first use).
+
+    Parameters are validated eagerly (same rules as ``connect_mysql``), but
+    the actual ``mysql.connector.connect`` call is deferred to the first
+    attribute access on the returned proxy.
+
+    Args:
+        host: Server hostname or IP address. Must be non-empty.
+        port: Server port. Must be a positive integer (e.g. 3306).
+        user: MySQL user name.
+        password: MySQL password (may be empty string).
+
+    Returns:
+        A ``LazyMySQLConnection`` wrapping the parameters.
+
+    Raises:
+        ValueError: If ``host`` is empty or ``port`` is not positive.
+    """
+    return LazyMySQLConnection(host=host, port=port, user=user, password=password)
+
+
+def schema_ready(cur, database: str, expected_tables: int) -> bool:
+    """Check whether a database already contains the expected tables.
+
+    A single ``information_schema`` probe that lets seed scripts skip their
+    idempotent DDL phase on re-seeds (CREATE ... IF NOT EXISTS statements
+    are no-ops then, but still parsed server-side, one round trip each).
+
+    Args:
+        cur: Database cursor.
+        database: Database (schema) name to probe.
+        expected_tables: Number of tables the schema should contain.
+
+    Returns:
+        True if the schema has at least ``expected_tables`` tables.
+    """
+    cur.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s",
+        (database,),
+    )
+    (count,) = cur.fetchone()
+    return count >= expected_tables
+
+
+def adaptive_batch(cur, rows: Sequence[tuple], floor: int = 100, ceiling: int = 10_000) -> int:
+    """Pick an executemany batch size that fits the server's packet limit.
+
+    Queries ``@@max_allowed_packet`` once and estimates the serialized row
+    size from a small sample, so large seeds send batches near the
+    throughput sweet spot without risking a packet-too-large error.
+
+    Args:
+        cur: Database cursor.
+        rows: Row tuples that will be inserted (only a prefix is sampled).
+        floor: Minimum batch size returned.
+        ceiling: Maximum batch size returned.
+
+    Returns:
+        A batch size between ``floor`` and ``ceiling``.
+    """
+    if not rows:
+        return floor
+    cur.execute("SELECT @@max_allowed_packet")
+    (max_pkt,) = cur.fetchone()
+    sample = rows[:10]
+    avg_row_bytes = max(1, sum(len(str(r)) for r in sample) // len(sample))
+    # Halve the packet budget to leave headroom for SQL text and escaping.
+    return max(floor, min(ceiling, max_pkt // (avg_row_bytes * 2)))
+
+
+def chunked(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    """Yield successive fixed-size chunks of an iterable.
+
+    Consumes the source lazily via ``islice``, so generators stream
+    through in O(size) memory and sequences are never copied up front —
+    each chunk is one list that ``executemany`` consumes directly.
+
+    Args:
+        rows: Iterable of tuples (e.g. row data for executemany).
+        size: Maximum number of elements per chunk. Must be positive.
+
+    Yields:
+        Lists of up to ``size`` elements from ``rows``.
+
+    Raises:
+        ValueError: If ``size`` is less than or equal to zero.
+    """
+    if size <= 0:
+        raise ValueError("chunk size must be > 0")
+    it = iter(rows)
+    while part := list(islice(it, size)):
+        yield part
+
+
+def exec_many(cur, sql: str, rows: Iterable[tuple], batch: int) -> int:
+    """Execute a parameterized statement for all rows in batches.
+
+    Uses the cursor's executemany in chunks of ``batch`` rows to avoid
+    huge single round-trips; the driver folds each chunk of plain-VALUES
+    inserts into one multi-row ``INSERT`` statement. The SQL is stripped
+    first — trailing whitespace or newlines defeat the driver's VALUES
+    regex and silently fall back to one round trip per row.
+
+    ``rows`` may be any iterable (including a generator): batches come
+    from ``chunked``, which consumes the source lazily, so callers can
+    stream rows without ever materializing the full set.
+
+    Args:
+        cur: Database cursor (e.g. from MySQLConnection.cursor()).
+        sql: Parameterized SQL (e.g. "INSERT INTO t (a,b) VALUES (%s,%s)").
+        rows: Iterable of parameter tuples (one per row).
+        batch: Maximum rows per executemany call. Must be positive.
+
+    Returns:
+        Total number of rows executed (0 for an empty iterable).
+
+    Raises:
+        ValueError: If ``batch`` is less than or equal to zero.
+    """
+    sql = sql.strip()
+    total = 0
+    for part in chunked(rows, batch):
+        cur.executemany(sql, part)
+        total += len(part)
+    return total
@@ -16,23 +16,41 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from random import Random
+from typing import NamedTuple
 
-from bd_exemplos.config import load_config
-from bd_exemplos.db import connect_mysql
+from bd_exemplos.config import MySQLConfig, load_config
+
+# bd_exemplos.db (and with it mysql.connector) is imported lazily inside the
+# functions that talk to the server, keeping module import — and thus CLI
+# startup and test collection — free of the driver's import cost.
 
 # config.toml at repository root (3 levels up from this file)
 CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / "config.toml"
 
+# Ceiling on rows per executemany call (folded into one multi-row INSERT by
+# the driver); the actual batch adapts to the server's max_allowed_packet.
+BATCH = 1000
+
+# Row count above which appointments go through LOAD DATA LOCAL INFILE
+# instead of multi-row INSERTs; small seeds keep the simpler path.
+INFILE_THRESHOLD = 10_000
+
 
 # -----------------------------
 # Models
 # -----------------------------
-@dataclass(frozen=True)
-class Medico:
+# Entities are NamedTuples: immutable like the frozen dataclasses they
+# replace, but cheaper to build and — being tuples whose field order matches
+# the INSERT column order — usable as executemany parameters directly.
+class Medico(NamedTuple):
     """A doctor (médico) entity.
 
     Attributes:
@@ -46,8 +64,7 @@ class Medico:
     especialidade: str
 
 
-@dataclass(frozen=True)
-class Paciente:
+class Paciente(NamedTuple):
     """A patient (paciente) entity.
 
     Attributes:
@@ -63,8 +80,7 @@ class Paciente:
     nif: str
 
 
-@dataclass(frozen=True)
-class Consulta:
+class Consulta(NamedTuple):
     """An appointment (consulta) entity.
 
     Attributes:
@@ -118,49 +134,140 @@ def build_pacientes() -> list[Paciente]:
     ]
 
 
-def build_consultas(rng: Random) -> list[Consulta]:
-    """Build sample appointments: fixed and random.
+def build_consultas(rng: Random, n: int = 50) -> Iterator[Consulta]:
+    """Generate sample appointments lazily.
 
     Args:
         rng: Random number generator for reproducibility.
+        n: Number of appointments to generate.
 
-    Returns:
-        A list of Consulta instances. Used to populate the ``consultas`` table.
+    Yields:
+        Consulta instances, one at a time, so enlarged seeds never hold the
+        full row set in memory. Used to populate the ``consultas`` table.
     """
-    consultas: list[Consulta] = []
-    cid = 1
     base = datetime(2025, 2, 1, 9, 0, 0)
     notas_opts = ["", "Controlo anual.", "Seguimento.", "Queixas de dores."]
-    for _ in range(50):
-        id_medico = rng.randint(1, 5)
-        id_paciente = rng.randint(1, 8)
-        dt = base + timedelta(
-            days=rng.randint(0, 60),
-            hours=rng.randint(0, 8),
-            minutes=rng.choice([0, 15, 30, 45]),
+    # Draw each random stream in one batched rng.choices call instead of
+    # ~5 per-row RNG calls; the sampling loop runs in C. The int batches
+    # are an order of magnitude smaller than the row objects they become.
+    medico_ids = rng.choices(range(1, 6), k=n)
+    paciente_ids = rng.choices(range(1, 9), k=n)
+    day_offs = rng.choices(range(61), k=n)
+    hour_offs = rng.choices(range(9), k=n)
+    minute_offs = rng.choices((0, 15, 30, 45), k=n)
+    notas = rng.choices(notas_opts, k=n)
+    for cid, (id_medico, id_paciente, days, hours, minutes, nota) in enumerate(
+        zip(medico_ids, paciente_ids, day_offs, hour_offs, minute_offs, notas), start=1
+    ):
+        yield Consulta(
+            cid,
+            id_medico,
+            id_paciente,
+            base + timedelta(days=days, hours=hours, minutes=minutes),
+            nota,
+        )
+
+
+# -----------------------------
+# Bulk load
+# -----------------------------
+def _insert_rows(cfg: MySQLConfig, sql: str, rows: Iterable[tuple]) -> int:
+    """Insert rows on a dedicated pooled connection (worker for parallel loads).
+
+    Each worker borrows its own connection from the pool, disables unique/FK
+    checks for its session (the seed data is consistent by construction, so
+    the tables become order-independent), inserts, and commits.
+
+    Args:
+        cfg: Connection settings.
+        sql: Parameterized INSERT statement.
+        rows: Parameter tuples to insert.
+
+    Returns:
+        Number of rows inserted.
+    """
+    from bd_exemplos.db import adaptive_batch, connect_mysql, exec_many
+
+    conn = connect_mysql(
+        host=cfg.host, port=cfg.port, user=cfg.user, password=cfg.password, pool=True
+    )
+    try:
+        cur = conn.cursor()
+        cur.execute("SET SESSION unique_checks=0")
+        cur.execute("SET SESSION foreign_key_checks=0")
+        # Plain cursor: executemany folds each batch into one multi-row
+        # INSERT, while a prepared cursor would execute row by row.
+        ins = conn.cursor()
+        # Materialize per worker (one table at a time, not all three at
+        # once); adaptive_batch needs to sample a prefix anyway.
+        rows = list(rows)
+        n = exec_many(ins, sql, rows, batch=adaptive_batch(cur, rows, ceiling=BATCH))
+        conn.commit()
+        return n
+    finally:
+        conn.close()
+
+
+def load_consultas_infile(cur, database: str, consultas: Iterable[Consulta]) -> int:
+    """Bulk-load appointments through ``LOAD DATA LOCAL INFILE``.
+
+    Serializes the rows to a temporary TSV file and streams it into the
+    server's bulk loader, bypassing per-row SQL parsing. Much faster than
+    multi-row INSERTs once row counts reach the tens of thousands; the
+    connection must be opened with ``allow_local_infile=True``.
+
+    Args:
+        cur: Database cursor.
+        database: Target database name.
+        consultas: Appointments to load. ``notas`` must not contain tabs
+            or newlines (true for the seed data).
+
+    Returns:
+        Number of rows loaded.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", newline="\n", suffix=".tsv", delete=False
+    )
+    count = 0
+    try:
+        with tmp:
+            for c in consultas:
+                tmp.write(
+                    f"{c.id_consulta}\t{c.id_medico}\t{c.id_paciente}\t{c.data_consulta}\t{c.notas}\n"
+                )
+                count += 1
+        # MySQL treats backslashes in the quoted literal as escapes, so
+        # Windows temp paths must be normalized to forward slashes.
+        path = tmp.name.replace("\\", "/")
+        cur.execute(
+            f"LOAD DATA LOCAL INFILE '{path}' "
+            f"INTO TABLE {database}.consultas "
+            "FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+            "(ID_Consulta, ID_Medico, ID_Paciente, Data_Consulta, Notas)"
         )
-        notas = rng.choice(notas_opts)
-        consultas.append(Consulta(cid, id_medico, id_paciente, dt, notas))
-        cid += 1
-    return consultas
+    finally:
+        os.unlink(tmp.name)
+    return count
 
 
 # -----------------------------
 # DDL
 # -----------------------------
-def ddl_clinica(database: str) -> list[str]:
+@functools.lru_cache(maxsize=4)
+def ddl_clinica(database: str) -> tuple[str, ...]:
     """Return SQL statements to create the clinic database and its tables.
 
     Creates the database (if not exists) with utf8mb4, then tables in
     dependency order: medicos, pacientes, consultas, with foreign
-    keys and indexes.
+    keys and indexes. Memoized per database name so library callers that
+    loop over ``main()`` do not rebuild the formatted SQL.
 
     Args:
         database: Database name (whitespace is stripped). Must be non-empty.
 
     Returns:
-        List of SQL strings (CREATE DATABASE, USE, CREATE TABLE ...). Execute
-        in order.
+        Tuple of SQL strings (CREATE DATABASE, USE, CREATE TABLE ...).
+        Execute in order.
 
     Raises:
         ValueError: If ``database`` is empty after stripping.
@@ -168,7 +275,7 @@ def ddl_clinica(database: str) -> list[str]:
     db = database.strip()
     if not db:
         raise ValueError("database must be non-empty")
-    return [
+    return (
         f"""
         CREATE DATABASE IF NOT EXISTS {db}
           DEFAULT CHARACTER SET utf8mb4
@@ -216,7 +323,7 @@ def ddl_clinica(database: str) -> list[str]:
             ON DELETE RESTRICT
         ) ENGINE=InnoDB
         """,
-    ]
+    )
 
 
 def main() -> None:
@@ -227,52 +334,94 @@ def main() -> None:
     if needed, clears existing data, inserts seed data, commits, and prints
     the number of rows inserted per table.
     """
+    from mysql.connector.constants import ClientFlag
+
+    from bd_exemplos.db import connect_mysql
+
     cfg = load_config(CONFIG_PATH)
     database = cfg.database
     rng = Random(42)
+    n_consultas = 50
 
     medicos = build_medicos()
     pacientes = build_pacientes()
-    consultas = build_consultas(rng)
+    consultas = build_consultas(rng, n=n_consultas)
 
+    # Pooled connection: repeated runs in the same process (tests, notebooks)
+    # reuse the session instead of re-doing the TCP/auth handshake; close()
+    # returns the connection to the pool.
     conn = connect_mysql(
         host=cfg.host,
         port=cfg.port,
         user=cfg.user,
         password=cfg.password,
+        client_flags=[ClientFlag.MULTI_STATEMENTS],
+        use_pure=False,
+        allow_local_infile=True,
+        pool=True,
     )
     conn.autocommit = False
 
     try:
         cur = conn.cursor()
-        for stmt in ddl_clinica(database):
-            cur.execute(stmt)
-
-        cur.execute(f"DELETE FROM {database}.consultas")
-        cur.execute(f"DELETE FROM {database}.pacientes")
-        cur.execute(f"DELETE FROM {database}.medicos")
-
-        cur.executemany(
-            f"INSERT INTO {database}.medicos (ID_Medico, Nome, Especialidade) VALUES (%s, %s, %s)",
-            [(m.id_medico, m.nome, m.especialidade) for m in medicos],
-        )
-        cur.executemany(
-            f"INSERT INTO {database}.pacientes (ID_Paciente, Nome, Data_Nascimento, NIF) VALUES (%s, %s, %s, %s)",
-            [(p.id_paciente, p.nome, p.data_nascimento, p.nif) for p in pacientes],
-        )
-        cur.executemany(
-            f"INSERT INTO {database}.consultas (ID_Consulta, ID_Medico, ID_Paciente, Data_Consulta, Notas) VALUES (%s, %s, %s, %s, %s)",
-            [
-                (c.id_consulta, c.id_medico, c.id_paciente, c.data_consulta, c.notas)
-                for c in consultas
-            ],
-        )
+        # Single round trip for all DDL statements (requires MULTI_STATEMENTS)
+        cur.execute(";\n".join(ddl_clinica(database)))
+        for _ in cur.fetchsets():  # drain the per-statement results
+            pass
+
+        # Bulk-load mode: defer unique/FK validation until the data is in.
+        # The seed data is consistent by construction (inserts stay in
+        # parent→child order), FK checks must be off for the TRUNCATEs
+        # anyway, and skipping per-row constraint work speeds up the insert
+        # phase. (ALTER TABLE ... DISABLE KEYS is a no-op on InnoDB, so the
+        # secondary indexes on consultas are left alone.)
+        cur.execute("SET SESSION unique_checks=0")
+        cur.execute("SET SESSION foreign_key_checks=0")
+
+        # Clear tables. TRUNCATE is a metadata operation — much faster than
+        # row-by-row DELETE; it also resets any auto-increment counters.
+        cur.execute(f"TRUNCATE TABLE {database}.consultas")
+        cur.execute(f"TRUNCATE TABLE {database}.pacientes")
+        cur.execute(f"TRUNCATE TABLE {database}.medicos")
+
+        # The entities are NamedTuples in INSERT column order, so the lists
+        # go to executemany as-is — no per-row tuple rebuild. With FK checks
+        # off the three loads are independent, so each job runs on its own
+        # pooled connection (one table per worker) and commits itself.
+        jobs = [
+            (
+                f"INSERT INTO {database}.medicos (ID_Medico, Nome, Especialidade) VALUES (%s, %s, %s)",
+                medicos,
+            ),
+            (
+                f"INSERT INTO {database}.pacientes (ID_Paciente, Nome, Data_Nascimento, NIF) VALUES (%s, %s, %s, %s)",
+                pacientes,
+            ),
+        ]
+        if n_consultas >= INFILE_THRESHOLD:
+            load_consultas_infile(cur, database, consultas)
+        else:
+            jobs.append(
+                (
+                    f"INSERT INTO {database}.consultas (ID_Consulta, ID_Medico, ID_Paciente, Data_Consulta, Notas) VALUES (%s, %s, %s, %s, %s)",
+                    consultas,
+                )
+            )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(_insert_rows, cfg, sql, rows) for sql, rows in jobs]
+            for fut in futures:
+                fut.result()
+
+        # Re-enable constraint checks before committing (the main session
+        # still holds the TRUNCATEs and any infile load).
+        cur.execute("SET SESSION unique_checks=1")
+        cur.execute("SET SESSION foreign_key_checks=1")
 
         conn.commit()
         print("DONE — Database created:", database)
         print(f"  doctors:       {len(medicos)}")
         print(f"  patients:      {len(pacientes)}")
-        print(f"  appointments:  {len(consultas)}")
+        print(f"  appointments:  {n_consultas}")
     except Exception:
         conn.rollback()
         raise
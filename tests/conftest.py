@@ -0,0 +1,70 @@
+"""Shared fixtures for the bd_exemplos test suite."""
+
+from __future__ import annotations
+
+from random import Random
+
+import pytest
+from bd_exemplos.scripts.seed_biblioteca import ddl_biblioteca
+from bd_exemplos.scripts.seed_cinema import build_sessoes, ddl_cinema
+from bd_exemplos.scripts.seed_clinica import ddl_clinica
+from bd_exemplos.scripts.seed_loja import build_static_entities, ddl_statements
+
+# The ddl_* builders are pure given the database name, so each is built
+# once per test session and shared as (statements, joined text) — the
+# positive-path tests only read them. Negative-path tests (empty names)
+# keep calling the builders directly.
+
+
+@pytest.fixture(scope="session")
+def ddl_biblioteca_stmts():
+    """Library DDL for "LIB_TEST", built once: (statements, joined text)."""
+    stmts = ddl_biblioteca("LIB_TEST")
+    return stmts, " ".join(stmts)
+
+
+@pytest.fixture(scope="session")
+def ddl_cinema_stmts():
+    """Cinema DDL for "CINEMA_TEST", built once: (statements, joined text)."""
+    stmts = ddl_cinema("CINEMA_TEST")
+    return stmts, " ".join(stmts)
+
+
+@pytest.fixture(scope="session")
+def ddl_clinica_stmts():
+    """Clinic DDL for "CLINICA_TEST", built once: (statements, joined text)."""
+    stmts = ddl_clinica("CLINICA_TEST")
+    return stmts, " ".join(stmts)
+
+
+@pytest.fixture(scope="session")
+def ddl_loja_stmts():
+    """Shop DDL for "TEST_DB", built once: (statements, joined text)."""
+    stmts = ddl_statements("TEST_DB")
+    return stmts, " ".join(stmts)
+
+
+@pytest.fixture(scope="session")
+def static_entities():
+    """Shop static entities (suppliers, products, clients), built once.
+
+    Deterministic data; tests sharing the fixture treat it as read-only.
+    Tests that need two independent builds keep calling the builder.
+    """
+    return build_static_entities()
+
+
+@pytest.fixture(scope="session")
+def sessoes_seed42():
+    """Cinema sessions for seed 42, built once and treated as read-only."""
+    return build_sessoes(Random(42))
+
+
+@pytest.fixture
+def rng42() -> Random:
+    """A Random seeded with 42, for tests that need a single seeded stream.
+
+    Tests comparing two independent same-seed builds (reproducibility)
+    keep instantiating their own generators.
+    """
+    return Random(42)
@@ -1,15 +1,16 @@
-"""Tests for data builders (seed_loja and seed_biblioteca)."""
+"""Tests for data builders (seed scripts)."""
 
 from __future__ import annotations
 
-from random import Random
-
+import pytest
 from bd_exemplos.scripts.seed_biblioteca import (
     build_autores,
     build_emprestimos,
     build_leitores,
     build_livros,
 )
+from bd_exemplos.scripts.seed_cinema import build_filmes, build_salas
+from bd_exemplos.scripts.seed_clinica import build_medicos, build_pacientes
 from bd_exemplos.scripts.seed_loja import build_static_entities
 
 # --- Shop: build_static_entities ---
@@ -23,24 +24,24 @@ def test_build_static_entities_returns_three_lists() -> None:
     assert isinstance(clients, list)
 
 
-def test_build_static_entities_suppliers_count_and_first() -> None:
+def test_build_static_entities_suppliers_count_and_first(static_entities) -> None:
     """Suppliers: 3 entities, first is Nike."""
-    suppliers, _, _ = build_static_entities()
+    suppliers, _, _ = static_entities
     assert len(suppliers) == 3
     assert suppliers[0].nome == "Nike"
     assert suppliers[0].id_fornecedor == 1
     assert suppliers[0].email == "sales@nike.pt"
 
 
-def test_build_static_entities_products_count() -> None:
+def test_build_static_entities_products_count(static_entities) -> None:
     """Products: 23 (includes never-sold)."""
-    _, products, _ = build_static_entities()
+    _, products, _ = static_entities
     assert len(products) == 23
 
 
-def test_build_static_entities_clients_count() -> None:
+def test_build_static_entities_clients_count(static_entities) -> None:
     """Clients: 10."""
-    _, _, clients = build_static_entities()
+    _, _, clients = static_entities
     assert len(clients) == 10
 
 
@@ -73,9 +74,50 @@ def test_build_leitores_count_and_first() -> None:
     assert leitores[0].email == "maria.oliveira@mail.pt"
 
 
-def test_build_emprestimos_returns_list() -> None:
+# --- Cinema and clinic: fixed entity builders ---
+
+
+@pytest.mark.parametrize(
+    ("builder", "expected_len", "first_attrs"),
+    [
+        pytest.param(
+            build_filmes,
+            6,
+            {"id_filme": 1, "titulo": "O Pátio das Cantigas", "duracao_min": 95, "ano": 1942},
+            id="cinema-filmes",
+        ),
+        pytest.param(
+            build_salas,
+            3,
+            {"id_sala": 1, "nome": "Sala 1", "capacidade": 120},
+            id="cinema-salas",
+        ),
+        pytest.param(
+            build_medicos,
+            5,
+            {"id_medico": 1, "especialidade": "Clínica Geral"},
+            id="clinica-medicos",
+        ),
+        pytest.param(
+            build_pacientes,
+            8,
+            {"id_paciente": 1, "nif": "123456789"},
+            id="clinica-pacientes",
+        ),
+    ],
+)
+def test_fixed_builders_count_and_first(builder, expected_len, first_attrs) -> None:
+    """Deterministic builders return the expected count and first entity."""
+    rows = builder()
+    assert len(rows) == expected_len
+    first = rows[0]
+    for attr, expected in first_attrs.items():
+        assert getattr(first, attr) == expected
+
+
+def test_build_emprestimos_returns_list(rng42) -> None:
     """build_emprestimos returns a list of loans."""
-    rng = Random(42)
+    rng = rng42
     emprestimos = build_emprestimos(rng)
     assert isinstance(emprestimos, list)
     assert len(emprestimos) >= 10  # fixed + random
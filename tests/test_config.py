@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from bd_exemplos.config import MySQLConfig, load_config
+from bd_exemplos.config import MySQLConfig, _load_from_bytes, load_config
+
+# match= pattern shared by the two missing-section tests, compiled once.
+_RE_MISSING_MYSQL = re.compile(r"Missing \[mysql\] section")
 
 
 def test_load_config_valid_toml(tmp_path: Path) -> None:
@@ -31,38 +36,32 @@ database = "BD_TESTE"
     assert cfg.database == "BD_TESTE"
 
 
-def test_load_config_accepts_empty_password(tmp_path: Path) -> None:
-    """load_config accepts empty password (local development)."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
+def test_load_config_accepts_empty_password() -> None:
+    """Empty password is accepted (local development)."""
+    cfg = _load_from_bytes(
+        b"""
 [mysql]
 host = "localhost"
 port = 3306
 user = "root"
 password = ""
 database = "BD"
-""",
-        encoding="utf-8",
+"""
     )
-    cfg = load_config(toml_file)
     assert cfg.password == ""
 
 
-def test_load_config_missing_password_uses_default(tmp_path: Path) -> None:
+def test_load_config_missing_password_uses_default() -> None:
     """When password is missing in TOML, empty string is used."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
+    cfg = _load_from_bytes(
+        b"""
 [mysql]
 host = "localhost"
 port = 3306
 user = "root"
 database = "BD"
-""",
-        encoding="utf-8",
+"""
     )
-    cfg = load_config(toml_file)
     assert cfg.password == ""
 
 
@@ -72,25 +71,14 @@ def test_load_config_file_not_found() -> None:
         load_config(Path("/does/not/exist/config.toml"))
 
 
-def test_load_config_missing_mysql_section(tmp_path: Path) -> None:
-    """TOML without [mysql] section raises ValueError."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
-[other]
-key = "value"
-""",
-        encoding="utf-8",
-    )
-    with pytest.raises(ValueError, match="Missing \\[mysql\\] section"):
-        load_config(toml_file)
-
-
-def test_load_config_port_must_be_int(tmp_path: Path) -> None:
-    """port must be a positive integer."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
+# Content-validation tests parse in-memory bytes via _load_from_bytes, so
+# no temp file is written; test_load_config_valid_toml keeps covering the
+# file-reading branch.
+@pytest.mark.parametrize(
+    ("body", "match"),
+    [
+        pytest.param(
+            b"""
 [mysql]
 host = "localhost"
 port = "3306"
@@ -98,17 +86,24 @@ user = "root"
 password = ""
 database = "BD"
 """,
-        encoding="utf-8",
-    )
-    with pytest.raises(ValueError, match="expected positive int"):
-        load_config(toml_file)
-
-
-def test_load_config_port_must_be_positive(tmp_path: Path) -> None:
-    """port must be > 0."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
+            "expected positive int",
+            id="port-string",
+        ),
+        pytest.param(
+            b"""
+[mysql]
+host = "localhost"
+port = true
+user = "root"
+password = ""
+database = "BD"
+""",
+            # port = true must not slip through as 1 (bool subclasses int).
+            "expected positive int",
+            id="port-bool",
+        ),
+        pytest.param(
+            b"""
 [mysql]
 host = "localhost"
 port = 0
@@ -116,17 +111,11 @@ user = "root"
 password = ""
 database = "BD"
 """,
-        encoding="utf-8",
-    )
-    with pytest.raises(ValueError, match="expected positive int"):
-        load_config(toml_file)
-
-
-def test_load_config_required_str_empty_fails(tmp_path: Path) -> None:
-    """Required fields (host, user, database) cannot be empty."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
+            "expected positive int",
+            id="port-zero",
+        ),
+        pytest.param(
+            b"""
 [mysql]
 host = ""
 port = 3306
@@ -134,48 +123,52 @@ user = "root"
 password = ""
 database = "BD"
 """,
-        encoding="utf-8",
-    )
-    with pytest.raises(ValueError, match="host"):
-        load_config(toml_file)
+            "host",
+            id="host-empty",
+        ),
+    ],
+)
+def test_load_config_invalid_field_raises(body: bytes, match: str) -> None:
+    """Invalid field values (bad port, empty required string) raise ValueError."""
+    with pytest.raises(ValueError, match=match):
+        _load_from_bytes(body)
+
+
+def test_load_config_missing_mysql_section() -> None:
+    """TOML without [mysql] section raises ValueError."""
+    with pytest.raises(ValueError, match=_RE_MISSING_MYSQL):
+        _load_from_bytes(b'[other]\nkey = "value"\n')
 
 
-def test_load_config_mysql_section_not_dict(tmp_path: Path) -> None:
+def test_load_config_mysql_section_not_dict() -> None:
     """When [mysql] is not a table (e.g. scalar), ValueError is raised."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text('mysql = "not a table"', encoding="utf-8")
-    with pytest.raises(ValueError, match="Missing \\[mysql\\] section"):
-        load_config(toml_file)
+    with pytest.raises(ValueError, match=_RE_MISSING_MYSQL):
+        _load_from_bytes(b'mysql = "not a table"')
 
 
-def test_load_config_password_not_string_fails(tmp_path: Path) -> None:
+def test_load_config_password_not_string_fails() -> None:
     """When password is present but not a string (e.g. int), ValueError is raised."""
-    toml_file = tmp_path / "config.toml"
-    toml_file.write_text(
-        """
+    with pytest.raises(ValueError, match="Invalid 'password'"):
+        _load_from_bytes(
+            b"""
 [mysql]
 host = "localhost"
 port = 3306
 user = "root"
 password = 1
 database = "BD"
-""",
-        encoding="utf-8",
-    )
-    with pytest.raises(ValueError, match="Invalid 'password'"):
-        load_config(toml_file)
+"""
+        )
 
 
 def test_load_config_root_not_dict(tmp_path: Path) -> None:
     """When TOML root is not a dict (edge case), ValueError is raised."""
-    from unittest.mock import patch
-
     toml_file = tmp_path / "config.toml"
     toml_file.write_text("key = true", encoding="utf-8")
 
-    def fake_loads(_s: str):
+    def fake_load(_f):
         return []  # not a dict
 
-    with patch("bd_exemplos.config.toml.loads", side_effect=fake_loads):
+    with patch("bd_exemplos.config.tomllib.load", side_effect=fake_load):
         with pytest.raises(ValueError, match="Config root must be a TOML table"):
             load_config(toml_file)
@@ -1,35 +1,189 @@
-"""Tests for bd_exemplos.db.connect_mysql."""
+"""Tests for bd_exemplos.db helpers."""
 
 from __future__ import annotations
 
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
-from bd_exemplos.db import connect_mysql
+from bd_exemplos import db
+from bd_exemplos.db import (
+    adaptive_batch,
+    chunked,
+    connect_mysql,
+    connect_mysql_lazy,
+    exec_many,
+    get_pool,
+    schema_ready,
+)
+
+# match= patterns used by several pytest.raises sites, compiled once.
+_RE_HOST_NONEMPTY = re.compile("host must be non-empty")
+_RE_PORT_POSITIVE = re.compile("port must be > 0")
+_RE_CHUNK_POSITIVE = re.compile("chunk size must be > 0")
+
+
+class _StubConnect:
+    """Callable recording its kwargs — much cheaper to build than MagicMock."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+        self.ret = object()
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.ret
 
 
 def test_connect_mysql_success_returns_connection() -> None:
     """With valid args, connect_mysql returns the result of mysql.connector.connect."""
-    fake_conn = MagicMock()
-    with patch("bd_exemplos.db.mysql.connector.connect", return_value=fake_conn) as mock_connect:
+    stub = _StubConnect()
+    with patch("bd_exemplos.db.mysql.connector.connect", new=stub):
         conn = connect_mysql(host="localhost", port=3306, user="u", password="p")
-    assert conn is fake_conn
-    mock_connect.assert_called_once_with(host="localhost", port=3306, user="u", password="p")
+    assert conn is stub.ret
+    assert stub.calls == [{"host": "localhost", "port": 3306, "user": "u", "password": "p"}]
 
 
 def test_connect_mysql_empty_host_raises() -> None:
     """Empty host raises ValueError."""
-    with pytest.raises(ValueError, match="host must be non-empty"):
+    with pytest.raises(ValueError, match=_RE_HOST_NONEMPTY):
         connect_mysql(host="", port=3306, user="u", password="p")
 
 
 def test_connect_mysql_port_zero_raises() -> None:
     """Port 0 raises ValueError."""
-    with pytest.raises(ValueError, match="port must be > 0"):
+    with pytest.raises(ValueError, match=_RE_PORT_POSITIVE):
         connect_mysql(host="localhost", port=0, user="u", password="p")
 
 
 def test_connect_mysql_negative_port_raises() -> None:
     """Negative port raises ValueError."""
-    with pytest.raises(ValueError, match="port must be > 0"):
+    with pytest.raises(ValueError, match=_RE_PORT_POSITIVE):
         connect_mysql(host="localhost", port=-1, user="u", password="p")
+
+
+def test_get_pool_caches_per_server() -> None:
+    """get_pool creates the pool once per (host, port, user) and reuses it."""
+    fake_pool = MagicMock()
+    with patch.dict(db._pools, clear=True):
+        with patch("bd_exemplos.db.MySQLConnectionPool", return_value=fake_pool) as mock_pool:
+            p1 = get_pool(host="localhost", port=3306, user="u", password="p")
+            p2 = get_pool(host="localhost", port=3306, user="u", password="p")
+    assert p1 is fake_pool
+    assert p2 is fake_pool
+    mock_pool.assert_called_once()
+
+
+def test_connect_mysql_pool_borrows_from_pool() -> None:
+    """connect_mysql(pool=True) returns a connection from the cached pool."""
+    fake_conn = MagicMock()
+    fake_pool = MagicMock()
+    fake_pool.get_connection.return_value = fake_conn
+    with patch.dict(db._pools, clear=True):
+        with patch("bd_exemplos.db.MySQLConnectionPool", return_value=fake_pool):
+            conn = connect_mysql(host="localhost", port=3306, user="u", password="p", pool=True)
+    assert conn is fake_conn
+    fake_pool.get_connection.assert_called_once_with()
+
+
+def test_connect_mysql_lazy_defers_connection() -> None:
+    """connect_mysql_lazy does not connect until first attribute access."""
+    fake_conn = MagicMock()
+    with patch("bd_exemplos.db.mysql.connector.connect", return_value=fake_conn) as mock_connect:
+        proxy = connect_mysql_lazy(host="localhost", port=3306, user="u", password="p")
+        mock_connect.assert_not_called()
+        proxy.cursor()
+        mock_connect.assert_called_once_with(host="localhost", port=3306, user="u", password="p")
+        proxy.commit()  # second access reuses the cached connection
+        mock_connect.assert_called_once()
+
+
+def test_connect_mysql_lazy_validates_eagerly() -> None:
+    """connect_mysql_lazy validates host/port without connecting."""
+    with pytest.raises(ValueError, match=_RE_HOST_NONEMPTY):
+        connect_mysql_lazy(host="", port=3306, user="u", password="p")
+    with pytest.raises(ValueError, match=_RE_PORT_POSITIVE):
+        connect_mysql_lazy(host="localhost", port=0, user="u", password="p")
+
+
+def test_schema_ready_true_when_tables_present() -> None:
+    """schema_ready returns True when the schema has enough tables."""
+    cur = MagicMock()
+    cur.fetchone.return_value = (4,)
+    assert schema_ready(cur, "BD", expected_tables=4) is True
+    cur.execute.assert_called_once_with(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s",
+        ("BD",),
+    )
+
+
+def test_schema_ready_false_when_tables_missing() -> None:
+    """schema_ready returns False when the schema has fewer tables."""
+    cur = MagicMock()
+    cur.fetchone.return_value = (0,)
+    assert schema_ready(cur, "BD", expected_tables=4) is False
+
+
+def test_adaptive_batch_clamps_to_bounds() -> None:
+    """adaptive_batch stays within [floor, ceiling] for extreme packet sizes."""
+    cur = MagicMock()
+    rows = [(i, "x" * 20) for i in range(100)]
+    cur.fetchone.return_value = (64 * 1024 * 1024,)  # huge packet -> ceiling
+    assert adaptive_batch(cur, rows, floor=100, ceiling=10_000) == 10_000
+    cur.fetchone.return_value = (1024,)  # tiny packet -> floor
+    assert adaptive_batch(cur, rows, floor=100, ceiling=10_000) == 100
+
+
+def test_adaptive_batch_empty_rows_returns_floor() -> None:
+    """adaptive_batch with no rows returns the floor without querying."""
+    cur = MagicMock()
+    assert adaptive_batch(cur, [], floor=100) == 100
+    cur.execute.assert_not_called()
+
+
+def test_chunked_yields_batches() -> None:
+    """chunked() yields lists of at most size elements."""
+    data = [(1,), (2,), (3,), (4,), (5,)]
+    assert list(chunked(data, 2)) == [[(1,), (2,)], [(3,), (4,)], [(5,)]]
+    assert list(chunked(data, 5)) == [data]
+    assert list(chunked([], 1)) == []
+
+
+def test_chunked_invalid_size_raises() -> None:
+    """chunked() raises ValueError for size <= 0."""
+    with pytest.raises(ValueError, match=_RE_CHUNK_POSITIVE):
+        list(chunked([(1,)], 0))
+    with pytest.raises(ValueError, match=_RE_CHUNK_POSITIVE):
+        list(chunked([(1,)], -1))
+
+
+def test_exec_many_empty_rows_returns_zero() -> None:
+    """exec_many with no rows returns 0."""
+    cur = MagicMock()
+    n = exec_many(cur, "INSERT INTO t VALUES (%s)", [], batch=10)
+    assert n == 0
+    cur.executemany.assert_not_called()
+
+
+class _RecordingCursor:
+    """Cursor double recording executemany calls, cheaper than MagicMock."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[tuple]]] = []
+
+    def executemany(self, sql: str, rows) -> None:
+        self.calls.append((sql, list(rows)))
+
+
+def test_exec_many_batches_correctly() -> None:
+    """exec_many calls executemany in batches."""
+    cur = _RecordingCursor()
+    rows = [(i,) for i in range(5)]
+    n = exec_many(cur, "INSERT INTO t VALUES (%s)", rows, batch=2)
+    assert n == 5
+    sql = "INSERT INTO t VALUES (%s)"
+    assert cur.calls == [  # 2+2+1, in order
+        (sql, [(0,), (1,)]),
+        (sql, [(2,), (3,)]),
+        (sql, [(4,)]),
+    ]
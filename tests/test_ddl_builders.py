@@ -0,0 +1,24 @@
+"""Shared negative-path tests for the ddl_* builders."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from bd_exemplos.scripts.seed_biblioteca import ddl_biblioteca
+from bd_exemplos.scripts.seed_cinema import ddl_cinema
+from bd_exemplos.scripts.seed_clinica import ddl_clinica
+from bd_exemplos.scripts.seed_loja import ddl_statements
+
+# match= pattern shared by all cases, compiled once.
+_RE_DB_NONEMPTY = re.compile("database must be non-empty")
+
+
+@pytest.mark.parametrize(
+    "builder", [ddl_biblioteca, ddl_cinema, ddl_clinica, ddl_statements]
+)
+@pytest.mark.parametrize("bad", ["", "   "])
+def test_ddl_builder_empty_database_raises(builder, bad: str) -> None:
+    """Every DDL builder rejects an empty or whitespace-only database name."""
+    with pytest.raises(ValueError, match=_RE_DB_NONEMPTY):
+        builder(bad)
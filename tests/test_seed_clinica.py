@@ -2,56 +2,67 @@
 
 from __future__ import annotations
 
-import pytest
-from bd_exemplos.scripts.seed_clinica import (
-    build_consultas,
-    build_medicos,
-    build_pacientes,
-    ddl_clinica,
-)
+from datetime import datetime
+from random import Random
 
+from bd_exemplos.scripts.seed_clinica import Consulta, build_consultas, load_consultas_infile
 
-def test_ddl_clinica_returns_create_and_use() -> None:
+
+def test_ddl_clinica_returns_create_and_use(ddl_clinica_stmts) -> None:
     """ddl_clinica returns CREATE DATABASE, USE, and CREATE TABLEs."""
-    stmts = ddl_clinica("CLINICA_TEST")
+    stmts, full = ddl_clinica_stmts
     assert len(stmts) >= 2
     assert "CREATE DATABASE" in stmts[0]
     assert "USE" in stmts[1] or "CLINICA_TEST" in stmts[1]
-    full = " ".join(stmts)
     assert "medicos" in full
     assert "pacientes" in full
     assert "consultas" in full
 
 
-def test_ddl_clinica_empty_database_raises() -> None:
-    """ddl_clinica with empty database name raises."""
-    with pytest.raises(ValueError, match="database must be non-empty"):
-        ddl_clinica("")
-    with pytest.raises(ValueError, match="database must be non-empty"):
-        ddl_clinica("   ")
+def test_build_consultas_reproducible() -> None:
+    """build_consultas is reproducible with same seed.
 
+    A small n suffices: determinism is per-draw, so 10 rows verify it
+    as well as the default 50 at a fifth of the RNG work.
+    """
+    c1 = list(build_consultas(Random(42), n=10))
+    c2 = list(build_consultas(Random(42), n=10))
+    assert len(c1) == len(c2) == 10
+    assert [x.id_consulta for x in c1] == [x.id_consulta for x in c2]
 
-def test_build_medicos() -> None:
-    """build_medicos returns deterministic list of doctors."""
-    medicos = build_medicos()
-    assert len(medicos) == 5
-    assert medicos[0].id_medico == 1
-    assert medicos[0].especialidade == "Clínica Geral"
 
+def test_build_consultas_respects_n() -> None:
+    """build_consultas yields exactly n appointments (default 50)."""
+    assert len(list(build_consultas(Random(1), n=10))) == 10
+    assert sum(1 for _ in build_consultas(Random(1))) == 50
 
-def test_build_pacientes() -> None:
-    """build_pacientes returns deterministic list of patients."""
-    pacientes = build_pacientes()
-    assert len(pacientes) == 8
-    assert pacientes[0].nif == "123456789"
 
+class _InfileCursor:
+    """Cursor double for LOAD DATA: records the SQL and the TSV body."""
 
-def test_build_consultas_reproducible() -> None:
-    """build_consultas is reproducible with same seed."""
-    from random import Random
+    def __init__(self) -> None:
+        self.sql = ""
+        self.body = ""
 
-    c1 = build_consultas(Random(42))
-    c2 = build_consultas(Random(42))
-    assert len(c1) == 50
-    assert len(c1) == len(c2)
-    assert [x.id_consulta for x in c1] == [x.id_consulta for x in c2]
+    def execute(self, sql: str) -> None:
+        self.sql = sql
+        # Read the temp file now — the loader unlinks it on return.
+        with open(sql.split("'")[1], encoding="utf-8") as fh:
+            self.body = fh.read()
+
+
+def test_load_consultas_infile_serializes_tsv() -> None:
+    """load_consultas_infile writes one tab-separated row per appointment."""
+    cur = _InfileCursor()
+    consultas = [
+        Consulta(1, 2, 3, datetime(2025, 3, 1, 9, 30), "Rotina"),
+        Consulta(2, 1, 4, datetime(2025, 3, 2, 14, 0), ""),
+    ]
+    n = load_consultas_infile(cur, "CLINICA_TEST", iter(consultas))
+    assert n == 2
+    assert "INTO TABLE CLINICA_TEST.consultas" in cur.sql
+    assert "\\" not in cur.sql.split("'")[1]  # path normalized for MySQL
+    assert cur.body == (
+        "1\t2\t3\t2025-03-01 09:30:00\tRotina\n2\t1\t4\t2025-03-02 14:00:00\t\n"
+    )
+    assert sum(1 for _ in build_consultas(Random(1))) == 50
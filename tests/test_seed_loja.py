@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
 from random import Random
-from unittest.mock import MagicMock
 
 import pytest
 from bd_exemplos.scripts.seed_loja import (
+    OrderLine,
     build_orders_and_lines,
-    build_static_entities,
     choose_size_for_product,
-    chunked,
     compute_practiced_price,
+    compute_practiced_prices,
     daterange_days,
-    ddl_statements,
-    exec_many,
+    index_statements,
+    load_lines_infile,
     money,
     quant2,
 )
 
+# Decimal parsing is not free; the bounds used inside the 100-price loop
+# are built once at module scope.
+_D_90 = Decimal("90.00")
+_D_100 = Decimal("100.00")
+
 
 def test_money_parses_and_rounds() -> None:
     """money() parses string and rounds to 2 decimal places."""
@@ -34,81 +39,68 @@ def test_quant2_rounds_decimal() -> None:
     assert quant2(Decimal("10.001")) == Decimal("10.00")
 
 
-def test_chunked_yields_batches() -> None:
-    """chunked() yields lists of at most size elements."""
-    data = [(1,), (2,), (3,), (4,), (5,)]
-    assert list(chunked(data, 2)) == [[(1,), (2,)], [(3,), (4,)], [(5,)]]
-    assert list(chunked(data, 5)) == [data]
-    assert list(chunked([], 1)) == []
-
-
-def test_chunked_invalid_size_raises() -> None:
-    """chunked() raises ValueError for size <= 0."""
-    with pytest.raises(ValueError, match="chunk size must be > 0"):
-        list(chunked([(1,)], 0))
-    with pytest.raises(ValueError, match="chunk size must be > 0"):
-        list(chunked([(1,)], -1))
-
-
-def test_daterange_days_returns_in_range() -> None:
+def test_daterange_days_returns_in_range(rng42) -> None:
     """daterange_days returns a date in [start, end_exclusive)."""
-    from datetime import date
-
-    rng = Random(42)
+    rng = rng42
     start = date(2024, 1, 1)
     end = date(2024, 1, 31)
+    # Compare ordinals (plain ints) inside the loop instead of date objects.
+    start_o = start.toordinal()
+    end_o = end.toordinal()
     for _ in range(20):
-        d = daterange_days(start, end, rng)
-        assert start <= d < end
+        o = daterange_days(start, end, rng).toordinal()
+        assert start_o <= o < end_o
 
 
-def test_daterange_days_invalid_range_raises() -> None:
+def test_daterange_days_invalid_range_raises(rng42) -> None:
     """daterange_days raises ValueError when end <= start."""
-    from datetime import date
-
-    rng = Random(42)
+    rng = rng42
     with pytest.raises(ValueError, match="Invalid date range"):
         daterange_days(date(2024, 1, 10), date(2024, 1, 10), rng)
     with pytest.raises(ValueError, match="Invalid date range"):
         daterange_days(date(2024, 1, 10), date(2024, 1, 5), rng)
 
 
-def test_choose_size_for_product_shoes_returns_numeric() -> None:
-    """Product 1 (shoes) gets numeric size."""
-    rng = Random(42)
-    sizes = {choose_size_for_product(1, rng) for _ in range(50)}
-    assert sizes.issubset({"40", "41", "42", "43", "44", "45"})
+@pytest.mark.parametrize(
+    ("pids", "allowed"),
+    [
+        pytest.param((1,), {"40", "41", "42", "43", "44", "45"}, id="shoes-numeric"),
+        pytest.param((2, 5, 6), {"S", "M", "L", "XL"}, id="apparel-sml"),
+        pytest.param((4, 7, 8, 9), {"U"}, id="one-size-u"),
+    ],
+)
+def test_choose_size_for_product(pids, allowed, rng42) -> None:
+    """Each product family only ever draws sizes from its allowed set."""
+    rng = rng42
+    picks = {choose_size_for_product(pid, rng) for pid in pids for _ in range(30)}
+    assert picks <= allowed
 
 
-def test_choose_size_for_product_apparel_returns_sml() -> None:
-    """Products 2,5,6 get S/M/L/XL."""
-    rng = Random(42)
-    for pid in (2, 5, 6):
-        s = choose_size_for_product(pid, rng)
-        assert s in ("S", "M", "L", "XL")
+def test_compute_practiced_price_in_range() -> None:
+    """Practiced prices are 2-decimal strings within 90-100% of base."""
+    rng = Random(12345)
+    base_cents = 10000  # 100.00
+    prices = compute_practiced_prices(base_cents, rng, 100)
+    assert len(prices) == 100
+    assert all(isinstance(p, str) for p in prices)
+    assert all(_D_90 <= Decimal(p) <= _D_100 for p in prices)
+    assert all(Decimal(p) == quant2(Decimal(p)) for p in prices)
 
 
-def test_choose_size_for_product_one_size_returns_u() -> None:
-    """Products 4,7,8,9 get U."""
-    rng = Random(42)
-    for pid in (4, 7, 8, 9):
-        assert choose_size_for_product(pid, rng) == "U"
+def test_compute_practiced_price_rounds_half_up() -> None:
+    """compute_practiced_price rounds discounted cents half-up."""
+    # 19.99 * 0.95 = 18.9905 -> 18.99; force the 5%-off branch (0.70 <= u < 0.95).
+    class _FixedU(Random):
+        def random(self) -> float:
+            return 0.80
 
-
-def test_compute_practiced_price_in_range() -> None:
-    """compute_practiced_price returns value between 90% and 100% of base."""
-    rng = Random(12345)
-    base = Decimal("100.00")
-    for _ in range(100):
-        p = compute_practiced_price(base, rng)
-        assert Decimal("90.00") <= p <= Decimal("100.00")
-        assert p == quant2(p)
+    assert compute_practiced_price(1999, _FixedU()) == "18.99"
 
 
-def test_build_orders_and_lines_minimal() -> None:
+def test_build_orders_and_lines_minimal(static_entities) -> None:
     """build_orders_and_lines with total_orders=50 returns orders and lines."""
     rng = Random(999)
-    _, products, clients = build_static_entities()
+    _, products, clients = static_entities
     orders, lines = build_orders_and_lines(
         rng=rng,
         products=products,
@@ -118,16 +110,28 @@ def test_build_orders_and_lines_minimal() -> None:
     assert len(orders) == 50
     assert len(lines) >= 50
     order_nums = {o.num_encomenda for o in orders}
-    for line in lines:
-        assert line.num_encomenda in order_nums
-        assert 1 <= line.id_produto <= 23
-        assert line.quantidade >= 1
+    # Whole-list checks (set subset + all()) instead of three asserts per line.
+    assert {line.num_encomenda for line in lines} <= order_nums
+    assert all(1 <= line.id_produto <= 23 for line in lines)
+    assert all(line.quantidade >= 1 for line in lines)
+
 
+def test_build_orders_and_lines_validate_false_same_output(static_entities) -> None:
+    """validate=False skips the checks but yields identical data per seed."""
+    _, products, clients = static_entities
+    checked = build_orders_and_lines(
+        rng=Random(999), products=products, clients=clients, total_orders=50
+    )
+    trusted = build_orders_and_lines(
+        rng=Random(999), products=products, clients=clients, total_orders=50, validate=False
+    )
+    assert checked == trusted
 
-def test_build_orders_and_lines_too_few_raises() -> None:
+
+def test_build_orders_and_lines_too_few_raises(static_entities, rng42) -> None:
     """build_orders_and_lines with total_orders < 50 raises."""
-    rng = Random(42)
-    _, products, clients = build_static_entities()
+    rng = rng42
+    _, products, clients = static_entities
     with pytest.raises(ValueError, match="total_orders should be reasonably large"):
         build_orders_and_lines(
             rng=rng,
@@ -137,13 +141,12 @@ def test_build_orders_and_lines_too_few_raises() -> None:
         )
 
 
-def test_ddl_statements_returns_create_and_use() -> None:
+def test_ddl_statements_returns_create_and_use(ddl_loja_stmts) -> None:
     """ddl_statements returns CREATE DATABASE, USE, and CREATE TABLEs."""
-    stmts = ddl_statements("TEST_DB")
+    stmts, full = ddl_loja_stmts
     assert len(stmts) >= 2
     assert "CREATE DATABASE" in stmts[0]
     assert "USE" in stmts[1] or "TEST_DB" in stmts[1]
-    full = " ".join(stmts)
     assert "fornecedores" in full
     assert "produtos" in full
     assert "clientes" in full
@@ -151,29 +154,53 @@ def test_ddl_statements_returns_create_and_use() -> None:
     assert "detalhes_venda" in full
 
 
-def test_ddl_statements_empty_database_raises() -> None:
-    """ddl_statements with empty database name raises."""
-    with pytest.raises(ValueError, match="database must be non-empty"):
-        ddl_statements("")
-    with pytest.raises(ValueError, match="database must be non-empty"):
-        ddl_statements("   ")
-
-
-def test_exec_many_empty_rows_returns_zero() -> None:
-    """exec_many with no rows returns 0."""
-    cur = MagicMock()
-    n = exec_many(cur, "INSERT INTO t VALUES (%s)", [], batch=10)
-    assert n == 0
-    cur.executemany.assert_not_called()
-
-
-def test_exec_many_batches_correctly() -> None:
-    """exec_many calls executemany in batches."""
-    cur = MagicMock()
-    rows = [(i,) for i in range(5)]
-    n = exec_many(cur, "INSERT INTO t VALUES (%s)", rows, batch=2)
-    assert n == 5
-    assert cur.executemany.call_count == 3  # 2+2+1
-    cur.executemany.assert_any_call("INSERT INTO t VALUES (%s)", [(0,), (1,)])
-    cur.executemany.assert_any_call("INSERT INTO t VALUES (%s)", [(2,), (3,)])
-    cur.executemany.assert_any_call("INSERT INTO t VALUES (%s)", [(4,)])
+class _InfileCursor:
+    """Cursor double for LOAD DATA: records the SQL and the TSV body."""
+
+    def __init__(self) -> None:
+        self.sql = ""
+        self.body = ""
+
+    def execute(self, sql: str) -> None:
+        self.sql = sql
+        # Read the temp file now — the loader unlinks it on return.
+        with open(sql.split("'")[1], encoding="utf-8") as fh:
+            self.body = fh.read()
+
+
+def test_load_lines_infile_serializes_tsv() -> None:
+    """load_lines_infile writes one tab-separated row per order line."""
+    cur = _InfileCursor()
+    lines = [
+        OrderLine("ENC-0001", 2, "M", 3, "19.99"),
+        OrderLine("ENC-0001", 5, "U", 1, "5.00"),
+    ]
+    n = load_lines_infile(cur, "TEST_DB", iter(lines))
+    assert n == 2
+    assert "INTO TABLE TEST_DB.detalhes_venda" in cur.sql
+    assert "\\" not in cur.sql.split("'")[1]  # path normalized for MySQL
+    assert cur.body == "ENC-0001\t2\tM\t3\t19.99\nENC-0001\t5\tU\t1\t5.00\n"
+
+
+class _IndexProbeCursor:
+    """Cursor double whose fetchall returns fixed existing index names."""
+
+    def __init__(self, existing: list[str]) -> None:
+        self._rows = [(name,) for name in existing]
+        self.executed: list[tuple[str, tuple]] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        self.executed.append((sql, params))
+
+    def fetchall(self) -> list[tuple[str]]:
+        return self._rows
+
+
+def test_index_statements_skips_existing() -> None:
+    """index_statements only emits ALTERs for indexes not yet present."""
+    cur = _IndexProbeCursor(existing=["idx_produtos_preco"])
+    stmts = index_statements(cur, "TEST_DB")
+    assert stmts == ["ALTER TABLE TEST_DB.encomendas ADD KEY idx_encomendas_data (Data)"]
+    ((sql, params),) = cur.executed
+    assert "information_schema.statistics" in sql
+    assert params == ("TEST_DB", "idx_produtos_preco", "idx_encomendas_data")